@@ -0,0 +1 @@
+# Makes the top-level modules (main, universe, utils) importable from tests/.
@@ -0,0 +1,105 @@
+import bottleneck as bn
+import numpy as np
+import pandas as pd
+
+# --- INDICATORS ---------------------------------------------------------------
+
+INDICATOR_COLS = frozenset({"sma20", "sma50", "sma200", "rsi14", "atr14", "vol_ma20", "trend_code"})
+
+
+def compute_indicators(df: pd.DataFrame) -> pd.DataFrame:
+    """Add technical indicators safely (RSI, SMAs, ATR, volume MA)."""
+    if df is None or df.empty:
+        return pd.DataFrame()
+
+    required_cols = {"close", "high", "low"}
+    if not required_cols.issubset(set(df.columns)):
+        return pd.DataFrame()
+
+    # Already computed (e.g. the detail tab hands its frame to the backtest)
+    if INDICATOR_COLS.issubset(df.columns):
+        return df
+
+    df = df.copy()
+
+    # Ensure 1D float series
+    close = df["close"].astype(float)
+    high = df["high"].astype(float)
+    low = df["low"].astype(float)
+
+    # Simple moving averages (bottleneck's C kernels, straight on the array).
+    # They run in float32: half the bytes per pass, and bottleneck keeps the
+    # output float32. Anything compared against them must use float32 too.
+    close_arr = close.to_numpy()
+    close32 = close_arr.astype(np.float32)
+    df["sma20"] = bn.move_mean(close32, 20, min_count=20)
+    df["sma50"] = bn.move_mean(close32, 50, min_count=50)
+    df["sma200"] = bn.move_mean(close32, 200, min_count=200)
+
+    # RSI 14 (Wilder's smoothing)
+    delta = close.diff()
+    gain = delta.clip(lower=0.0)
+    loss = (-delta).clip(lower=0.0)
+
+    avg_gain = gain.ewm(alpha=1 / 14, adjust=False, min_periods=14).mean()
+    avg_loss = loss.ewm(alpha=1 / 14, adjust=False, min_periods=14).mean()
+    rs = avg_gain / (avg_loss + 1e-9)
+    df["rsi14"] = 100.0 - (100.0 / (1.0 + rs))
+
+    # ATR 14 (Wilder's smoothing)
+    h = high.to_numpy()
+    lo = low.to_numpy()
+    prev_close = np.roll(close_arr, 1)
+    prev_close[0] = np.nan
+    # fmax skips the NaN prev close on the first bar, so TR there is high - low
+    tr = np.fmax.reduce([h - lo, np.abs(h - prev_close), np.abs(lo - prev_close)])
+    tr = pd.Series(tr, index=df.index)
+    df["atr14"] = tr.ewm(alpha=1 / 14, adjust=False, min_periods=14).mean()
+
+    # Volume 20-day average
+    if "volume" in df.columns:
+        df["vol_ma20"] = bn.move_mean(df["volume"].to_numpy(dtype=np.float32), 20, min_count=20)
+    else:
+        df["vol_ma20"] = np.nan
+
+    df["trend_code"] = compute_trend_code(df)
+
+    return df
+
+
+# Trend codes stored in df["trend_code"]; labels are for display only.
+TREND_NONE, TREND_STRONG_UP, TREND_UP, TREND_STRONG_DOWN, TREND_DOWN, TREND_SIDEWAYS = range(6)
+CODE_TO_LABEL = (
+    "No Trend (insufficient data)",
+    "Strong Uptrend",
+    "Uptrend",
+    "Strong Downtrend",
+    "Downtrend",
+    "Sideways / Mixed",
+)
+
+
+def compute_trend_code(df: pd.DataFrame) -> np.ndarray:
+    """Simple trend classification for every bar at once (int8 trend codes)."""
+    # Compare at the SMAs' float32 precision so close vs SMA tests agree everywhere
+    c = df["close"].to_numpy(dtype=np.float32)
+    s20 = df["sma20"].to_numpy()
+    s50 = df["sma50"].to_numpy()
+    s200 = df["sma200"].to_numpy()
+
+    no_data = np.isnan(s20) | np.isnan(s50) | np.isnan(s200)
+    up = (c > s20) & (s20 > s50)
+    down = (c < s20) & (s20 < s50)
+
+    codes = np.select(
+        [
+            no_data,
+            up & (s50 > s200),
+            up & (s200 <= s50),
+            down & (s50 < s200),
+            down,
+        ],
+        [TREND_NONE, TREND_STRONG_UP, TREND_UP, TREND_STRONG_DOWN, TREND_DOWN],
+        default=TREND_SIDEWAYS,
+    )
+    return codes.astype(np.int8)
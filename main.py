@@ -1,31 +1,11 @@
 import argparse
 import sys
-import textwrap
-from utils import alerts  # assumes utils/alerts.py already exists as we set up before
-
-# --- SYMBOL UNIVERSES ---------------------------------------------------------
-
-# You can edit/expand these lists any time.
-STOCK_UNIVERSE = [
-    # Mega-cap tech / growth
-    "AAPL", "MSFT", "TSLA", "NVDA", "AMZN", "META", "GOOGL", "NFLX",
-    # Semis / AI
-    "AMD", "AVGO", "SMCI",
-    # Index / sector ETFs
-    "SPY", "QQQ", "IWM", "XLK", "XLF",
-]
-
-CRYPTO_UNIVERSE = [
-    # Majors
-    "BTC/USD", "ETH/USD", "SOL/USD",
-    # Meme / degen names
-    "DOGE/USD", "SHIB/USD", "PEPE/USD", "FLOKI/USD", "BONK/USD",
-]
-
+from universe import expand_symbols
+from utils import alerts_async
 
 # --- ARG PARSING --------------------------------------------------------------
 
-def parse_args():
+def parse_args(argv=None):
     p = argparse.ArgumentParser(description="AI Trades Bot")
 
     p.add_argument("--mode", choices=["paper", "live"], default="paper")
@@ -52,61 +32,47 @@ def parse_args():
     p.add_argument("--trail_pct", type=float, default=0.0)
     p.add_argument("--notify", action="store_true")
 
-    return p.parse_args()
-
-
-# --- SYMBOL EXPANSION ---------------------------------------------------------
-
-def expand_symbols(args):
-    """
-    Turn args.symbols into a clean list.
-
-    Rules:
-    - If symbols is empty or 'ALL' -> use the universe for the asset_class.
-    - Otherwise, split the comma-separated list.
-    """
-    raw = (args.symbols or "").strip()
-
-    if not raw or raw.upper() == "ALL":
-        if args.asset_class == "stock":
-            syms = STOCK_UNIVERSE
-        elif args.asset_class == "crypto":
-            syms = CRYPTO_UNIVERSE
-        else:
-            # Fallback: everything
-            syms = STOCK_UNIVERSE + CRYPTO_UNIVERSE
-    else:
-        syms = [s.strip() for s in raw.split(",") if s.strip()]
-
-    return syms
+    # argv=None reads sys.argv; pass a list to build args in-process
+    return p.parse_args(argv)
 
 
 def notify_if_enabled(args, msg: str):
     if args.notify:
-        alerts.discord(msg)
+        alerts_async.discord(msg)
 
 
 # --- MAIN BOT LOGIC STUB ------------------------------------------------------
 
+# Fixed layout, filled per run with format_map (no per-call dedent).
+_BANNER = (
+    "Running AI Trades Bot\n"
+    "--------------------\n"
+    "Mode          : {mode}\n"
+    "Asset Class   : {asset_class}\n"
+    "Symbols       : {symbols}\n"
+    "Strategy      : {strategy}\n"
+    "Capital       : {capital}\n"
+    "Risk per Trade: {risk}\n"
+    "Interval      : {interval}\n"
+    "Partials      : {partials}\n"
+    "Trailing Stop : {trail_pct}\n"
+    "Broker        : {broker}\n"
+    "Notifications : {notify}"
+)
+
+
 def run_bot(args):
     symbols_list = expand_symbols(args)
     symbols_str = ",".join(symbols_list)
 
-    summary = textwrap.dedent(f"""
-        Running AI Trades Bot
-        --------------------
-        Mode          : {args.mode}
-        Asset Class   : {args.asset_class}
-        Symbols       : {symbols_str}
-        Strategy      : {args.strategy}
-        Capital       : {args.capital}
-        Risk per Trade: {args.risk}
-        Interval      : {args.interval}
-        Partials      : {args.partials}
-        Trailing Stop : {args.trail_pct}
-        Broker        : {args.broker or 'None'}
-        Notifications : {'On' if args.notify else 'Off'}
-    """).strip()
+    summary = _BANNER.format_map(
+        {
+            **vars(args),
+            "symbols": symbols_str,
+            "broker": args.broker or "None",
+            "notify": "On" if args.notify else "Off",
+        }
+    )
 
     print(summary)
 
@@ -129,6 +95,10 @@ def run_bot(args):
     # 🔔 Discord: run finished
     notify_if_enabled(args, "✔️ Bot run complete.")
 
+    # Deliver queued alerts before returning, so in-process callers don't
+    # need to know about the background sender.
+    alerts_async.flush()
+
 
 def main():
     args = parse_args()
@@ -1,10 +1,13 @@
 import pandas as pd
 import yfinance as yf
 
+from universe import to_yahoo
+from utils.http import SESSION
+
 class Scanner:
     def _download(self, symbols, period="5d", interval="1d"):
         tickers = " ".join(symbols)
-        raw = yf.download(tickers=tickers, period=period, interval=interval, progress=False, group_by="ticker")
+        raw = yf.download(tickers=tickers, period=period, interval=interval, progress=False, group_by="ticker", session=SESSION)
         if isinstance(raw, pd.DataFrame) and len(symbols) == 1:
             return {symbols[0]: raw}
         return raw
@@ -27,5 +30,5 @@ class Scanner:
 
     def scan_futures(self): return self.scan_stocks(["ES=F","NQ=F","YM=F","GC=F","CL=F"])
     def scan_forex(self): return self.scan_stocks(["EURUSD=X","GBPUSD=X","JPY=X","AUDUSD=X"])
-    def scan_crypto(self, symbols): return self.scan_stocks([s.replace("/","") for s in symbols])
-    def scan_memecoins(self): return self.scan_crypto(["DOGE/USD","SHIB/USD","PEPE/USD","FLOKI/USD"])
\ No newline at end of file
+    def scan_crypto(self, symbols): return self.scan_stocks([to_yahoo(s) for s in symbols])
+    def scan_memecoins(self): return self.scan_crypto(["DOGE/USD","SHIB/USD"])
\ No newline at end of file
@@ -1,8 +1,28 @@
+import sys
+from pathlib import Path
+
 import streamlit as st
 import pandas as pd
 import numpy as np
-import yfinance as yf
 from datetime import datetime, timedelta
+from numba import njit
+
+# `streamlit run streamlit/app.py` only puts this folder on sys.path; the shared
+# helpers live one level up. Streamlit re-runs this script on every interaction,
+# so only add it once.
+_ROOT = str(Path(__file__).resolve().parent.parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from indicators import (
+    CODE_TO_LABEL,
+    TREND_NONE,
+    TREND_STRONG_DOWN,
+    TREND_STRONG_UP,
+    compute_indicators,
+)
+from universe import CRYPTO_UNIVERSE, STOCK_UNIVERSE, to_yahoo
+from utils import price_cache
 
 # -------------------
 # CONFIG & UNIVERSES
@@ -10,29 +30,8 @@ from datetime import datetime, timedelta
 
 st.set_page_config(page_title="AI Market Bot", layout="wide")
 
-# Liquid stock universe (you can add/remove tickers any time)
-STOCK_UNIVERSE = [
-    # Mega-cap tech / growth
-    "AAPL", "MSFT", "NVDA", "TSLA", "AMZN", "META", "GOOGL", "NFLX",
-    # Semis / AI
-    "AMD", "AVGO", "SMCI", "INTC",
-    # Index / sector ETFs
-    "SPY", "QQQ", "IWM", "XLK", "XLF", "XLE", "XLV",
-]
-
-# Crypto universe limited to tickers Yahoo Finance actually supports
-CRYPTO_UNIVERSE = [
-    "BTC-USD",
-    "ETH-USD",
-    "SOL-USD",
-    "BNB-USD",
-    "XRP-USD",
-    "DOGE-USD",
-    "SHIB-USD",
-    "ADA-USD",
-    "AVAX-USD",
-    "DOT-USD",
-]
+# Universes live in universe.py; crypto is stored as BTC/USD, Yahoo wants BTC-USD
+CRYPTO_YAHOO = tuple(to_yahoo(s) for s in CRYPTO_UNIVERSE)
 
 # -------------------
 # DATA & INDICATORS
@@ -40,142 +39,130 @@ CRYPTO_UNIVERSE = [
 
 @st.cache_data(show_spinner=False)
 def load_history(symbol: str, period: str = "6mo", interval: str = "1d") -> pd.DataFrame:
-    """Download historical data for a single symbol."""
-    df = yf.download(symbol, period=period, interval=interval, auto_adjust=True, progress=False)
-    if df.empty:
-        return df
-    # Normalize columns and index
-    df = df.rename(columns=str.lower)
-    try:
-        df.index = df.index.tz_localize(None)
-    except Exception:
-        pass
-    return df
-
-
-def compute_indicators(df: pd.DataFrame) -> pd.DataFrame:
-    """Add technical indicators safely (RSI, SMAs, ATR, volume MA)."""
-    if df is None or df.empty:
-        return pd.DataFrame()
-
-    required_cols = {"close", "high", "low"}
-    if not required_cols.issubset(set(df.columns)):
-        return pd.DataFrame()
+    """Load historical data for a single symbol (disk cache, then Yahoo)."""
+    return price_cache.get(symbol, period=period, interval=interval)
 
-    df = df.copy()
 
-    # Ensure 1D float series
-    close = df["close"].astype(float)
-    high = df["high"].astype(float)
-    low = df["low"].astype(float)
+@st.cache_data(show_spinner=False)
+def load_histories(symbols: tuple, period: str = "6mo", interval: str = "1d") -> dict:
+    """Load historical data for many symbols; cache misses share one batched request."""
+    return price_cache.get_many(symbols, period=period, interval=interval)
 
-    # Simple moving averages
-    df["sma20"] = close.rolling(20).mean()
-    df["sma50"] = close.rolling(50).mean()
-    df["sma200"] = close.rolling(200).mean()
 
-    # RSI 14
-    delta = close.diff()
-    gain = delta.clip(lower=0)
-    loss = (-delta).clip(lower=0)
+# Scanner signals, best first; also the sort order of the results table.
+SIGNAL_ORDER = ("Momentum Long", "Oversold Watch", "Avoid / Short Bias", "No Trade")
 
-    roll_up = gain.rolling(14).mean()
-    roll_down = loss.rolling(14).mean()
-    rs = roll_up / (roll_down + 1e-9)
-    df["rsi14"] = 100.0 - (100.0 / (1.0 + rs))
 
-    # ATR 14
-    tr = pd.DataFrame(
-        {
-            "hl": high - low,
-            "hc": (high - close.shift()).abs(),
-            "lc": (low - close.shift()).abs(),
-        }
-    ).max(axis=1)
-    df["atr14"] = tr.rolling(14).mean()
-
-    # Volume 20-day average
-    if "volume" in df.columns:
-        df["vol_ma20"] = df["volume"].rolling(20).mean()
-    else:
-        df["vol_ma20"] = np.nan
+_SIGNAL_INPUT_COLS = frozenset({"close", "rsi14", "sma200", "atr14", "trend_code"})
 
-    return df
-
-
-def classify_trend(last_close, sma20, sma50, sma200) -> str:
-    """Simple trend classification."""
-    if np.isnan(sma20) or np.isnan(sma50) or np.isnan(sma200):
-        return "No Trend (insufficient data)"
-    if last_close > sma20 > sma50 > sma200:
-        return "Strong Uptrend"
-    if last_close > sma20 > sma50 and sma200 <= sma50:
-        return "Uptrend"
-    if last_close < sma20 < sma50 < sma200:
-        return "Strong Downtrend"
-    if last_close < sma20 < sma50:
-        return "Downtrend"
-    return "Sideways / Mixed"
 
+def _scorable(df) -> bool:
+    """True if df is an indicator frame generate_signals can stack and score."""
+    return (
+        isinstance(df, pd.DataFrame)
+        and len(df) >= 30
+        and df.index.nlevels == 1
+        and _SIGNAL_INPUT_COLS.issubset(df.columns)
+    )
 
-def generate_signal_row(symbol: str, df: pd.DataFrame, capital: float, risk_pct: float):
-    """Generate a single row of signal info for scanner."""
-    if df is None or df.empty or len(df) < 30:
-        return None
 
-    last = df.iloc[-1]
-    prev = df.iloc[-2]
+def generate_signals(frames: dict, capital: float, risk_pct: float) -> pd.DataFrame:
+    """
+    Generate the scanner table for all symbols at once.
 
-    last_close = float(last["close"])
-    prev_close = float(prev["close"])
-    pct_change = (last_close - prev_close) / prev_close * 100.0
+    frames maps symbol -> indicator DataFrame. They are stacked into one frame
+    keyed by symbol, and every signal column is derived from the last bar of
+    each symbol with vectorized array math (one row per symbol).
+    """
+    # Validate each frame before stacking, so one malformed symbol is skipped
+    # (like the per-symbol scan loop does) instead of breaking the whole table.
+    frames = {sym: df for sym, df in frames.items() if _scorable(df)}
+    if not frames:
+        return pd.DataFrame()
 
-    rsi = float(last.get("rsi14", np.nan))
-    sma20 = float(last.get("sma20", np.nan))
-    sma50 = float(last.get("sma50", np.nan))
-    sma200 = float(last.get("sma200", np.nan))
-    atr = float(last.get("atr14", np.nan))
+    stacked = pd.concat(frames, names=["symbol", "date"])
+    by_symbol = stacked.groupby(level="symbol", sort=False)
+    last = by_symbol.tail(1).droplevel("date")
+    prev = by_symbol["close"].nth(-2).droplevel("date").reindex(last.index)
+
+    last_close = last["close"].to_numpy(dtype=np.float64)
+    prev_close = prev.to_numpy(dtype=np.float64)
+    rsi = last["rsi14"].to_numpy(dtype=np.float64)
+    # SMAs are float32; the close-vs-SMA test below uses a float32 close to match
+    sma200 = last["sma200"].to_numpy()
+    last_close32 = last_close.astype(np.float32)
+    atr = last["atr14"].to_numpy(dtype=np.float64)
+    trend_code = last["trend_code"].to_numpy()
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct_change = np.where(prev_close != 0, (last_close - prev_close) / prev_close * 100.0, 0.0)
+
+    # Basic signal logic, first match wins:
+    # - Momentum long: strong uptrend, RSI in healthy range
+    # - Oversold bounce watch
+    # - Breakdown risk
+    signal = np.select(
+        [
+            (trend_code == TREND_STRONG_UP) & (rsi >= 55) & (rsi <= 75) & (pct_change > 0),
+            (rsi < 30) & (last_close32 > sma200),
+            (trend_code == TREND_STRONG_DOWN) & (rsi < 45),
+        ],
+        ["Momentum Long", "Oversold Watch", "Avoid / Short Bias"],
+        default="No Trade",
+    )
 
-    trend = classify_trend(last_close, sma20, sma50, sma200)
+    # Risk management: ATR-based stop & position size
+    stop_distance = np.where(atr > 0, atr, last_close * 0.03)  # fallback 3%
+    stop_loss = last_close - stop_distance
+    denom = last_close - stop_loss
+    # A NaN stop (NaN last close) still gets a row, with risk but zero size
+    risk_dollars = np.where(stop_loss <= 0, 0.0, capital * risk_pct)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        position_size = np.where((stop_loss > 0) & (denom > 0), risk_dollars / denom, 0.0)
 
-    # Basic signal logic
-    signal = "No Trade"
+    return pd.DataFrame(
+        {
+            "Symbol": last.index.to_numpy(),
+            "Last Price": np.round(last_close, 4),
+            "1D %": np.round(pct_change, 2),
+            "RSI14": np.round(rsi, 2),
+            "Trend": np.asarray(CODE_TO_LABEL)[trend_code],
+            "Signal": pd.Categorical(signal, categories=SIGNAL_ORDER, ordered=True),
+            "ATR14": np.round(atr, 4),
+            "Suggested Stop": np.round(stop_loss, 4),
+            "Risk $": np.round(risk_dollars, 2),
+            "Size (units)": position_size.astype(int),
+        }
+    )
 
-    # Momentum long: strong uptrend, RSI in healthy range
-    if trend.startswith("Strong Uptrend") and 55 <= rsi <= 75 and pct_change > 0:
-        signal = "Momentum Long"
 
-    # Oversold bounce watch
-    elif rsi < 30 and last_close > sma200:
-        signal = "Oversold Watch"
+# error_model="numpy": a 0 open (Yahoo does return those) gives inf like plain
+# NumPy would, instead of raising ZeroDivisionError and crashing the detail tab.
+@njit(cache=True, error_model="numpy")
+def _momentum_backtest_kernel(close, open_, sma20, trend, rsi):
+    """
+    Momentum state machine over raw arrays; returns per-trade returns.
 
-    # Breakdown risk
-    elif trend.startswith("Strong Downtrend") and rsi < 45:
-        signal = "Avoid / Short Bias"
+    Entry on the next bar's open after a strong-uptrend bar with RSI 55-75,
+    exit on the first close below SMA20 or RSI < 50. Returns use the float64
+    prices; the SMA20 exit test rounds the close to float32 like the SMA.
+    """
+    out = np.empty(len(close))
+    k = 0
+    in_trade = False
+    entry = 0.0
 
-    # Risk management: ATR-based stop & position size
-    stop_distance = atr if atr > 0 else last_close * 0.03  # fallback 3%
-    stop_loss = last_close - stop_distance
-    if stop_loss <= 0:
-        position_size = 0
-        risk_dollars = 0
-    else:
-        risk_dollars = capital * risk_pct
-        denom = (last_close - stop_loss)
-        position_size = risk_dollars / denom if denom > 0 else 0
+    for i in range(1, len(close)):
+        if not in_trade:
+            if trend[i - 1] == TREND_STRONG_UP and 55 <= rsi[i - 1] <= 75:
+                in_trade = True
+                entry = open_[i]
+        elif np.float32(close[i]) < sma20[i] or rsi[i] < 50:
+            out[k] = (close[i] - entry) / entry
+            k += 1
+            in_trade = False
 
-    return {
-        "Symbol": symbol,
-        "Last Price": round(last_close, 4),
-        "1D %": round(pct_change, 2),
-        "RSI14": round(rsi, 2) if not np.isnan(rsi) else np.nan,
-        "Trend": trend,
-        "Signal": signal,
-        "ATR14": round(atr, 4) if not np.isnan(atr) else np.nan,
-        "Suggested Stop": round(stop_loss, 4),
-        "Risk $": round(risk_dollars, 2),
-        "Size (units)": int(position_size),
-    }
+    return out[:k]
 
 
 def simple_backtest_momentum(df: pd.DataFrame):
@@ -188,47 +175,30 @@ def simple_backtest_momentum(df: pd.DataFrame):
     if df is None or df.empty or len(df) < 60:
         return {"Trades": 0, "Win %": np.nan, "Avg R": np.nan, "Total R": np.nan}
 
-    df = df.copy()
     df = compute_indicators(df)
-    df = df.dropna(subset=["sma20", "sma50", "sma200", "rsi14"])
-
     if df.empty:
         return {"Trades": 0, "Win %": np.nan, "Avg R": np.nan, "Total R": np.nan}
 
-    in_trade = False
-    entry_price = None
-    results = []
-
-    for i in range(1, len(df)):
-        row_prev = df.iloc[i - 1]
-        row = df.iloc[i]
-
-        # Build a "momentum signal" condition like in scanner
-        trend = classify_trend(row_prev["close"], row_prev["sma20"], row_prev["sma50"], row_prev["sma200"])
-        momentum_cond = (
-            trend.startswith("Strong Uptrend")
-            and 55 <= row_prev["rsi14"] <= 75
-            and row_prev["close"] > row_prev["close"] * 0.995  # avoid flat days
-        )
-
-        if not in_trade and momentum_cond:
-            in_trade = True
-            entry_price = row["open"] if "open" in df.columns else row["close"]
-            continue
-
-        if in_trade:
-            exit_cond = (row["close"] < row["sma20"]) or (row["rsi14"] < 50)
-            if exit_cond:
-                exit_price = row["close"]
-                r = (exit_price - entry_price) / entry_price
-                results.append(r)
-                in_trade = False
-                entry_price = None
-
-    if not results:
+    # Pull every column the loop needs into ndarrays once, then drop the
+    # indicator warm-up bars with a boolean mask instead of df.dropna().
+    open_col = "open" if "open" in df.columns else "close"
+    c = df["close"].to_numpy(dtype=np.float64)
+    o = df[open_col].to_numpy(dtype=np.float64)
+    s20 = df["sma20"].to_numpy()  # float32; the kernel compares closes at this precision
+    r = df["rsi14"].to_numpy(dtype=np.float64)
+    trend = df["trend_code"].to_numpy()
+
+    # TREND_NONE already marks bars where any SMA is still NaN
+    valid = (trend != TREND_NONE) & ~np.isnan(r)
+    if not valid.any():
         return {"Trades": 0, "Win %": np.nan, "Avg R": np.nan, "Total R": np.nan}
 
-    wins = sum(1 for r in results if r > 0)
+    results = _momentum_backtest_kernel(c[valid], o[valid], s20[valid], trend[valid], r[valid])
+
+    if len(results) == 0:
+        return {"Trades": 0, "Win %": np.nan, "Avg R": np.nan, "Total R": np.nan}
+
+    wins = int((results > 0).sum())
     trades = len(results)
     win_pct = wins / trades * 100
     avg_r = np.mean(results)
@@ -282,13 +252,13 @@ with tab_scan:
 
     if run_scan:
         if universe_choice == "Default (liquid names)":
-            symbols = STOCK_UNIVERSE if asset_class == "Stocks" else CRYPTO_UNIVERSE
+            symbols = STOCK_UNIVERSE if asset_class == "Stocks" else CRYPTO_YAHOO
         else:
             if not custom_symbols.strip():
                 st.warning("You selected Custom symbols but didn't enter any.")
-                symbols = []
+                symbols = ()
             else:
-                raw = [s.strip() for s in custom_symbols.split(",") if s.strip()]
+                raw = tuple(to_yahoo(s) for s in custom_symbols.split(",") if s.strip())
                 symbols = raw
 
         if not symbols:
@@ -296,16 +266,19 @@ with tab_scan:
 
         st.write(f"Scanning **{len(symbols)}** symbols...")
 
-        rows = []
+        frames = {}
         progress = st.progress(0)
         status = st.empty()
 
+        status.text(f"Downloading {len(symbols)} symbols...")
+        histories = load_histories(symbols, period=period, interval=interval)
+
         for i, sym in enumerate(symbols):
             progress.progress(int((i + 1) / len(symbols) * 100))
-            status.text(f"Loading {sym} ({i+1}/{len(symbols)})")
+            status.text(f"Computing indicators for {sym} ({i+1}/{len(symbols)})")
 
             try:
-                df = load_history(sym, period=period, interval=interval)
+                df = histories.get(sym)
 
                 # Skip invalid / empty data frames
                 if df is None or df.empty or "close" not in df.columns:
@@ -315,9 +288,7 @@ with tab_scan:
                 if df is None or df.empty:
                     continue
 
-                row = generate_signal_row(sym, df, capital, risk_pct)
-                if row:
-                    rows.append(row)
+                frames[sym] = df
             except Exception:
                 # Skip symbols that fail
                 continue
@@ -325,26 +296,15 @@ with tab_scan:
         progress.empty()
         status.empty()
 
-        if not rows:
+        df_signals = generate_signals(frames, capital, risk_pct)
+
+        if df_signals.empty:
             st.error("No valid data returned for any symbols. Try a different period/timeframe.")
         else:
-            df_signals = pd.DataFrame(rows)
-            # Sort: Momentum Long first, then by 1D %
-            df_signals["SignalRank"] = df_signals["Signal"].map(
-                {
-                    "Momentum Long": 0,
-                    "Oversold Watch": 1,
-                    "Avoid / Short Bias": 2,
-                    "No Trade": 3,
-                }
-            ).fillna(4)
-
-            df_signals = df_signals.sort_values(["SignalRank", "1D %"], ascending=[True, False])
-
-            st.dataframe(
-                df_signals.drop(columns=["SignalRank"]),
-                use_container_width=True,
-            )
+            # Sort: Momentum Long first (ordered categorical), then by 1D %
+            df_signals = df_signals.sort_values(["Signal", "1D %"], ascending=[True, False])
+
+            st.dataframe(df_signals, use_container_width=True)
 
             st.caption("Signals are NOT financial advice. Use them as a starting point, not as blind orders.")
     else:
@@ -361,7 +321,7 @@ with tab_detail:
     symbol = st.text_input("Symbol", value=default_symbol)
 
     if st.button("Analyze Symbol"):
-        df = load_history(symbol, period=period, interval=interval)
+        df = load_history(to_yahoo(symbol), period=period, interval=interval)
         if df is None or df.empty:
             st.error("No data for that symbol / timeframe.")
         else:
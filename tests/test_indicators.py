@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+
+from indicators import compute_indicators
+
+
+def _history(n=1750, start=60000.0, seed=0):
+    # ~1y of hourly bars at BTC-like prices: the longest, largest series the app scans
+    rng = np.random.default_rng(seed)
+    close = start * np.exp(np.cumsum(rng.normal(0.0, 0.01, n)))
+    return pd.DataFrame(
+        {
+            "open": close * (1 + rng.normal(0.0, 0.002, n)),
+            "high": close * 1.01,
+            "low": close * 0.99,
+            "close": close,
+            "volume": rng.integers(1_000_000, 5_000_000_000, n).astype(float),
+        },
+        index=pd.date_range("2025-01-01", periods=n, freq="h"),
+    )
+
+
+def test_float32_moving_averages_match_float64_reference():
+    raw = _history()
+    df = compute_indicators(raw)
+
+    for col, src, window in [
+        ("sma20", "close", 20),
+        ("sma50", "close", 50),
+        ("sma200", "close", 200),
+        ("vol_ma20", "volume", 20),
+    ]:
+        assert df[col].dtype == np.float32
+        expected = raw[src].rolling(window).mean().to_numpy()
+        np.testing.assert_allclose(df[col].to_numpy(), expected, rtol=1e-5)
+
+
+def test_prices_stay_float64():
+    df = compute_indicators(_history())
+    assert df["close"].dtype == np.float64
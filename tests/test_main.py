@@ -0,0 +1,20 @@
+from main import parse_args, run_bot
+from universe import STOCK_UNIVERSE
+
+
+def test_run_bot_in_process_with_explicit_symbols(capsys):
+    args = parse_args(["--asset_class", "crypto", "--symbols", "BTC/USD, ETH/USD"])
+    run_bot(args)
+
+    out = capsys.readouterr().out
+    assert "Asset Class   : crypto" in out
+    assert "Symbols       : BTC/USD,ETH/USD" in out
+    assert "Notifications : Off" in out
+
+
+def test_run_bot_in_process_expands_default_universe(capsys):
+    run_bot(parse_args([]))
+
+    out = capsys.readouterr().out
+    assert f"Symbols       : {','.join(STOCK_UNIVERSE)}" in out
+    assert "Broker        : None" in out
@@ -0,0 +1,58 @@
+# --- SYMBOL UNIVERSES ---------------------------------------------------------
+
+# Single source of truth for the CLI bot, the Streamlit app and the scanner.
+# You can edit/expand these any time.
+STOCK_UNIVERSE = (
+    # Mega-cap tech / growth
+    "AAPL", "MSFT", "NVDA", "TSLA", "AMZN", "META", "GOOGL", "NFLX",
+    # Semis / AI
+    "AMD", "AVGO", "SMCI", "INTC",
+    # Index / sector ETFs
+    "SPY", "QQQ", "IWM", "XLK", "XLF", "XLE", "XLV",
+)
+
+# Crypto is kept in broker format (BTC/USD); use to_yahoo() for market data.
+# Limited to pairs Yahoo Finance actually supports.
+CRYPTO_UNIVERSE = (
+    # Majors
+    "BTC/USD", "ETH/USD", "SOL/USD", "BNB/USD", "XRP/USD",
+    "ADA/USD", "AVAX/USD", "DOT/USD",
+    # Meme names
+    "DOGE/USD", "SHIB/USD",
+)
+
+# Tuples (not lists) so they're immutable, hashable and safe to hand out as-is
+ALL_UNIVERSE = STOCK_UNIVERSE + CRYPTO_UNIVERSE
+
+
+# --- NORMALIZATION ------------------------------------------------------------
+
+def to_yahoo(sym: str) -> str:
+    """Convert a broker-style symbol to Yahoo's format (BTC/USD -> BTC-USD)."""
+    return sym.strip().upper().replace("/", "-")
+
+
+# --- SYMBOL EXPANSION ---------------------------------------------------------
+
+def expand_symbols(args):
+    """
+    Turn args.symbols into a clean tuple.
+
+    Rules:
+    - If symbols is empty or 'ALL' -> use the universe for the asset_class.
+    - Otherwise, split the comma-separated list.
+    """
+    raw = (args.symbols or "").strip()
+
+    if not raw or raw.upper() == "ALL":
+        if args.asset_class == "stock":
+            syms = STOCK_UNIVERSE
+        elif args.asset_class == "crypto":
+            syms = CRYPTO_UNIVERSE
+        else:
+            # Fallback: everything
+            syms = ALL_UNIVERSE
+    else:
+        syms = tuple(s.strip() for s in raw.split(",") if s.strip())
+
+    return syms
@@ -0,0 +1,56 @@
+import os
+import queue
+import threading
+
+import requests
+
+# --- BACKGROUND DISCORD SENDER ------------------------------------------------
+
+# Webhook posts are queued and delivered by one daemon thread, so callers never
+# wait on the HTTPS round trip. Messages keep their order.
+# Set DISCORD_WEBHOOK_URL in the environment; without it alerts are dropped.
+WEBHOOK_URL = os.environ.get("DISCORD_WEBHOOK_URL", "")
+_alert_queue = queue.Queue()
+_worker = None
+_worker_lock = threading.Lock()
+
+
+def _run():
+    while True:
+        msg = _alert_queue.get()
+        try:
+            if WEBHOOK_URL:
+                requests.post(WEBHOOK_URL, json={"content": msg}, timeout=5)
+        except Exception:
+            # A failed alert must never take down the sender thread.
+            pass
+        finally:
+            _alert_queue.task_done()
+
+
+def _ensure_worker():
+    global _worker
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(target=_run, name="discord-alerts", daemon=True)
+            _worker.start()
+
+
+def discord(msg: str):
+    """Queue a Discord message and return immediately."""
+    _ensure_worker()
+    _alert_queue.put_nowait(msg)
+
+
+def flush(timeout: float = 10.0):
+    """
+    Wait for queued messages to be sent (call before exiting).
+
+    Gives up after `timeout` seconds so a hung webhook can't block exit;
+    anything still queued is dropped with the daemon thread.
+    """
+    if _worker is None:
+        return
+    waiter = threading.Thread(target=_alert_queue.join, daemon=True)
+    waiter.start()
+    waiter.join(timeout)
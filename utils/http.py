@@ -0,0 +1,8 @@
+from curl_cffi import requests as curl_requests
+
+# --- SHARED HTTP SESSION ------------------------------------------------------
+
+# One keep-alive session passed to every yf.download call (disk cache and
+# Scanner alike), so all Yahoo traffic shares a single connection pool.
+# yfinance requires a curl_cffi session.
+SESSION = curl_requests.Session(impersonate="chrome")
@@ -0,0 +1,179 @@
+import os
+import re
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+import yfinance as yf
+
+from utils.http import SESSION
+
+# --- DISK CACHE FOR PRICE HISTORY ---------------------------------------------
+
+# One Parquet file per (symbol, period, interval). Survives app restarts, unlike
+# st.cache_data which only lives as long as the Streamlit process.
+CACHE_DIR = Path.home() / ".cache" / "ai-trade-bot"
+
+_INTERVAL_UNITS = {
+    "m": timedelta(minutes=1),
+    "h": timedelta(hours=1),
+    "d": timedelta(days=1),
+    "wk": timedelta(weeks=1),
+    "mo": timedelta(days=30),
+}
+
+
+# Daily-or-longer bars finalize at the session close. Stocks use a fixed 16:00
+# New York close on weekdays (holidays ignored); crypto rolls over at 00:00 UTC.
+_DAILY_UNITS = {"d", "wk", "mo"}
+_NY = ZoneInfo("America/New_York")
+
+
+def _parse_interval(interval: str):
+    """Split "1d" into (1, "d"); None for intervals we don't understand."""
+    m = re.fullmatch(r"(\d+)([a-z]+)", interval.strip().lower())
+    if not m or m.group(2) not in _INTERVAL_UNITS:
+        return None
+    return int(m.group(1)), m.group(2)
+
+
+def max_age_seconds(interval: str) -> float:
+    """
+    How long a cached file stays fresh: half of one bar.
+
+    A "1d" history is reused for 12 hours, a "1h" history for 30 minutes.
+    Unknown intervals are never considered fresh.
+    """
+    parsed = _parse_interval(interval)
+    if parsed is None:
+        return 0.0
+    n, unit = parsed
+    return (n * _INTERVAL_UNITS[unit]).total_seconds() / 2
+
+
+def last_session_close(symbol: str, now: datetime = None) -> float:
+    """Epoch seconds of the most recent daily close at or before `now`."""
+    now = now or datetime.now(timezone.utc)
+
+    if symbol.upper().endswith("-USD"):
+        # Yahoo crypto pairs (BTC-USD, ...) trade 24/7 with a UTC daily bar
+        close = now.astimezone(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        return close.timestamp()
+
+    local = now.astimezone(_NY)
+    close = local.replace(hour=16, minute=0, second=0, microsecond=0)
+    if local < close:
+        close -= timedelta(days=1)
+    while close.weekday() >= 5:
+        close -= timedelta(days=1)
+    return close.timestamp()
+
+
+def _path(symbol: str, period: str, interval: str) -> Path:
+    safe = symbol.replace("/", "-")
+    return CACHE_DIR / f"{safe}_{period}_{interval}.parquet"
+
+
+def _normalize(df: pd.DataFrame) -> pd.DataFrame:
+    """Lower-case OHLCV columns and drop timezone info from the index."""
+    if isinstance(df.columns, pd.MultiIndex):
+        df = df.droplevel(-1, axis=1)
+    df = df.rename(columns=str.lower).dropna(how="all")
+    try:
+        df.index = df.index.tz_localize(None)
+    except Exception:
+        pass
+    return df
+
+
+def _read_fresh(symbol: str, period: str, interval: str):
+    path = _path(symbol, period, interval)
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    if time.time() - mtime >= max_age_seconds(interval):
+        return None
+
+    # A daily file written mid-session holds a partial last bar; once the
+    # session has closed since then, it must be re-downloaded.
+    parsed = _parse_interval(interval)
+    if parsed and parsed[1] in _DAILY_UNITS and mtime < last_session_close(symbol):
+        return None
+
+    try:
+        return pd.read_parquet(path)
+    except Exception:
+        # Corrupt / half-written file: treat as a miss and re-download.
+        return None
+
+
+def _write(symbol: str, period: str, interval: str, df: pd.DataFrame):
+    # Intervals that are never fresh would only ever be written, never read.
+    if df.empty or max_age_seconds(interval) <= 0:
+        return
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(_path(symbol, period, interval), compression="zstd")
+    except Exception:
+        # Caching is best-effort; never fail a scan because the disk did.
+        pass
+
+
+def get(symbol: str, period: str = "6mo", interval: str = "1d") -> pd.DataFrame:
+    """Return history for one symbol, from disk if fresh, else from Yahoo."""
+    df = _read_fresh(symbol, period, interval)
+    if df is not None:
+        return df
+
+    df = yf.download(
+        symbol, period=period, interval=interval, auto_adjust=True, progress=False, session=SESSION
+    )
+    if df.empty:
+        return df
+    df = _normalize(df)
+    _write(symbol, period, interval, df)
+    return df
+
+
+def get_many(symbols, period: str = "6mo", interval: str = "1d") -> dict:
+    """
+    Return {symbol: history} for many symbols.
+
+    Fresh files are read from disk; everything else is fetched in a single
+    batched yf.download call and written back to the cache.
+    """
+    out = {}
+    missing = []
+    for sym in symbols:
+        df = _read_fresh(sym, period, interval)
+        if df is None:
+            missing.append(sym)
+        else:
+            out[sym] = df
+
+    if len(missing) == 1:
+        out[missing[0]] = get(missing[0], period=period, interval=interval)
+    elif missing:
+        raw = yf.download(
+            tickers=missing,
+            period=period,
+            interval=interval,
+            group_by="ticker",
+            auto_adjust=True,
+            threads=True,
+            progress=False,
+            session=SESSION,
+        )
+        tickers = raw.columns.get_level_values(0) if isinstance(raw.columns, pd.MultiIndex) else []
+        for sym in missing:
+            if sym not in tickers:
+                out[sym] = pd.DataFrame()
+                continue
+            df = _normalize(raw[sym])
+            _write(sym, period, interval, df)
+            out[sym] = df
+
+    return {sym: out[sym] for sym in symbols}